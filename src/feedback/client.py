@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
 from simlp.run import parse_and_compute_distance
 
 
-@dataclass
+# Frozen: with cache_results=True one instance is returned to every caller
+@dataclass(frozen=True)
 class FeedbackResult:
     similarity: float
     optimal_matching: Any
@@ -17,8 +19,18 @@ class FeedbackResult:
 
 
 class FeedbackClient:
-    def __init__(self, log_file: str | Path = "logs/simlp_feedback.log"):
+    def __init__(
+        self,
+        log_file: str | Path = "logs/simlp_feedback.log",
+        cache_results: bool = False,
+    ):
         self.log_file = Path(log_file)
+        self.cache_results = cache_results
+        # simLP is deterministic, so an identical (generated, ground truth) pair
+        # (e.g. an LLM repeating itself across iterations) can be scored once.
+        # Opt-in: cache hits skip the simLP log and share one result object.
+        if cache_results:
+            self._evaluate = lru_cache(maxsize=128)(self._evaluate)
 
     def evaluate(
         self,
@@ -26,6 +38,14 @@ class FeedbackClient:
         ground_truth_rules: str,
         *,
         generate_feedback: bool = True,
+    ) -> FeedbackResult:
+        return self._evaluate(generated_rules, ground_truth_rules, generate_feedback)
+
+    def _evaluate(
+        self,
+        generated_rules: str,
+        ground_truth_rules: str,
+        generate_feedback: bool,
     ) -> FeedbackResult:
         # Ensure log directory exists before simLP writes
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -11,7 +11,7 @@ class LLMConfig:
     timeout: Optional[float] = None
     extra: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(frozen=True)
 class FewShotExample:
     user: str
     assistant: str
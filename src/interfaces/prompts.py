@@ -54,19 +54,17 @@ class PromptBuilder(ABC):
         """Combine domain examples with prerequisite fluents.
         
         Order: domain examples first (teach format), then prerequisites (context).
+        Exact duplicates are kept only at their first position.
         """
-        fewshots: List[FewShotExample] = []
-        
         # 1. Domain examples (teach the LLM how to write rules)
-        examples = self.get_fewshot_examples()
-        if examples:
-            fewshots.extend(examples)
-        
+        examples = self.get_fewshot_examples() or ()
+
         # 2. Prerequisites (previously learned fluents from RuleMemory)
-        if prerequisites:
-            fewshots.extend(prerequisites)
-        
-        return fewshots
+        prerequisites = prerequisites or ()
+
+        # FewShotExample is frozen (hashable), so any repeated example, domain
+        # or prerequisite, is dropped in the same pass
+        return list(dict.fromkeys((*examples, *prerequisites)))
     
     @abstractmethod
     def get_system_prompt(self) -> str:
@@ -20,7 +20,17 @@ class RuleMemoryEntry:
     
     Stores a fluent's rules along with its evaluation score and metadata.
     """
-    
+
+    # Fixed attribute set; avoids a per-entry __dict__
+    __slots__ = (
+        "fluent_name",
+        "rules",
+        "score",
+        "created_at",
+        "id",
+        "natural_language_description",
+    )
+
     def __init__(
         self,
         fluent_name: str,
@@ -180,6 +190,10 @@ class RuleMemory:
         """
         return fluent_name in self._storage
     
+    def __contains__(self, fluent_name: str) -> bool:
+        """Support ``fluent_name in memory`` (same as has_entry)."""
+        return self.has_entry(fluent_name)
+    
     def get_formatted_rules(
         self,
         fluent_names: List[str],
@@ -238,8 +252,8 @@ class RuleMemory:
         
         for entry in entries:
             lines.append(f"% Fluent: {entry.fluent_name} (score: {entry.score:.3f})")
-            for rule in entry.rules:
-                lines.append(rule)
+            # rules is one string; appending it whole avoids a line per character
+            lines.append(entry.rules)
             lines.append("")
         
         return "\n".join(lines)
@@ -259,8 +273,7 @@ class RuleMemory:
         for entry in entries:
             lines.append(f"### {entry.fluent_name} (score: {entry.score:.3f})\n")
             lines.append("```prolog")
-            for rule in entry.rules:
-                lines.append(rule)
+            lines.append(entry.rules)
             lines.append("```\n")
         
         return "\n".join(lines)
@@ -271,7 +284,7 @@ class RuleMemory:
         Returns:
             List of fluent names
         """
-        return list(self._storage.keys())
+        return list(self._storage)
     
     def get_statistics(self) -> Dict[str, any]:
         """Get memory statistics.
@@ -294,7 +307,7 @@ class RuleMemory:
             "average_score": sum(scores) / len(scores),
             "min_score": min(scores),
             "max_score": max(scores),
-            "fluent_names": list(self._storage.keys()),
+            "fluent_names": list(self._storage),
         }
     
     def clear(self) -> None:
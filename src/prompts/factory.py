@@ -15,35 +15,50 @@ from src.interfaces.exceptions import PromptBuilderNotFoundError
 # Registry mapping domain names to builder classes
 _BUILDER_REGISTRY: Dict[str, Type[PromptBuilder]] = {}
 
+# Builders are stateless, so a single instance per domain is shared
+_INSTANCE_CACHE: Dict[str, PromptBuilder] = {}
+
 def register_prompt_builder(domain: str, builder_class: Type[PromptBuilder]) -> None:
     """Register a prompt builder for a domain.
     
+    Re-registering a domain drops its cached instance.
+    
     Args:
         domain: Domain name (e.g., 'msa', 'har')
         builder_class: PromptBuilder subclass to register
     """
-    _BUILDER_REGISTRY[domain.lower()] = builder_class
+    key = domain.lower()
+    _BUILDER_REGISTRY[key] = builder_class
+    _INSTANCE_CACHE.pop(key, None)
 
 def get_prompt_builder(domain: str) -> PromptBuilder:
-    """Get a prompt builder instance for the specified domain.
+    """Get the prompt builder instance for the specified domain.
+    
+    The builder is instantiated on first use and reused afterwards.
     
     Args:
         domain: Domain name (e.g., 'msa', 'har')
         
     Returns:
-        Instantiated PromptBuilder for the domain
+        PromptBuilder for the domain
         
     Raises:
         PromptBuilderNotFoundError: If no builder is registered for the domain
     """
-    builder_class = _BUILDER_REGISTRY.get(domain.lower())
+    key = domain.lower()
+    builder = _INSTANCE_CACHE.get(key)
+    if builder is not None:
+        return builder
+    
+    builder_class = _BUILDER_REGISTRY.get(key)
     if not builder_class:
         available = ", ".join(_BUILDER_REGISTRY.keys()) or "none"
         raise PromptBuilderNotFoundError(
             f"No prompt builder found for domain '{domain}'. "
             f"Available domains: {available}"
         )
-    return builder_class()
+    builder = _INSTANCE_CACHE[key] = builder_class()
+    return builder
 
 def list_available_domains() -> list[str]:
     """List all registered domain names."""
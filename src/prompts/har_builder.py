@@ -6,6 +6,13 @@ from src.interfaces.prompts import PromptBuilder
 from src.prompts.rtec_base import basic_system_messages, example_system_messages
 from src.prompts.har_domain import har_system_messages
 
+
+# The system prompt is fixed, so it is assembled once at import
+_HAR_SYSTEM_PROMPT: str = "\n\n".join(
+    basic_system_messages + example_system_messages + har_system_messages
+)
+
+
 class HARPromptBuilder(PromptBuilder):
     """Prompt builder for Human Activity Recognition domain.
     
@@ -22,9 +29,7 @@ class HARPromptBuilder(PromptBuilder):
     
     def get_system_prompt(self) -> str:
         """Return complete system prompt (base RTEC + HAR domain)."""
-        parts: List[str] = list(basic_system_messages + example_system_messages)
-        parts.extend(har_system_messages)
-        return "\n\n".join(parts)
+        return _HAR_SYSTEM_PROMPT
     
     def get_fewshot_examples(self) -> List[FewShotExample]:
         return []
@@ -1,5 +1,5 @@
 """MSA (Maritime Situational Awareness) domain prompt builder."""
-from typing import List
+from typing import List, Tuple
 
 from src.interfaces.models import FewShotExample
 from src.interfaces.prompts import PromptBuilder
@@ -8,6 +8,19 @@ from src.prompts.msa_domain import system_MSA, system_MSA_events, system_MSA_BK
 from src.prompts.msa_examples import simple_fluent_examples, static_fluent_examples
 
 
+# The system prompt and few-shot examples are fixed, so they are assembled once at import
+_MSA_SYSTEM_PROMPT: str = "\n\n".join(
+    basic_system_messages
+    + example_system_messages
+    + [system_MSA, system_MSA_events, system_MSA_BK]
+)
+
+_MSA_FEWSHOTS: Tuple[FewShotExample, ...] = tuple(
+    FewShotExample(user=ex["input"].strip(), assistant=ex["output"].strip())
+    for ex in simple_fluent_examples + static_fluent_examples
+)
+
+
 class MSAPromptBuilder(PromptBuilder):
     """Prompt builder for Maritime Situational Awareness domain.
     
@@ -24,19 +37,8 @@ class MSAPromptBuilder(PromptBuilder):
     
     def get_system_prompt(self) -> str:
         """Return complete system prompt (base RTEC + MSA domain)."""
-        parts: List[str] = list(basic_system_messages + example_system_messages)
-        parts.extend([system_MSA, system_MSA_events, system_MSA_BK])
-        return "\n\n".join(parts)
+        return _MSA_SYSTEM_PROMPT
     
     def get_fewshot_examples(self) -> List[FewShotExample]:
         """Return MSA few-shot examples (simple + static fluents)."""
-        examples: List[FewShotExample] = []
-        
-        for ex in simple_fluent_examples + static_fluent_examples:
-            examples.append(FewShotExample(
-                user=ex["input"].strip(),
-                assistant=ex["output"].strip()
-            ))
-        
-        return examples
-
+        return list(_MSA_FEWSHOTS)
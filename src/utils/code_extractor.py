@@ -54,6 +54,10 @@ def extract_all_code_blocks(text: str) -> List[Tuple[str, str]]:
         >>> extract_all_code_blocks(text)
         [('python', 'print("hello")\\n')]
     """
+    # A block needs an opening and a closing fence; skip the regex otherwise
+    if text.count("```") < 2:
+        return []
+
     matches = CODE_BLOCK_PATTERN.findall(text)
     return [(lang.lower().strip(), code) for lang, code in matches]
 
@@ -96,21 +100,15 @@ def extract_prolog_blocks(
         >>> extract_prolog_blocks(text)
         'initiatedAt(gap(Vessel)=nearPorts, T) :-\\n    happensAt(gap_start(Vessel), T).\\n\\nterminatedAt(gap(Vessel)=_Status, T) :-\\n    happensAt(gap_end(Vessel), T).'
     """
-    all_blocks = extract_all_code_blocks(text)
-    
-    prolog_blocks: List[str] = []
-    
-    for lang, code in all_blocks:
-        # Check if this is a Prolog-like block (excluding empty string check)
-        is_prolog = lang in PROLOG_ALIASES and lang != ""
-        is_untagged = lang == ""
-        
-        if is_prolog or (is_untagged and include_untagged):
-            block = code.strip() if strip_whitespace else code
-            if block:  # Only add non-empty blocks
-                prolog_blocks.append(block)
-    
-    return "\n\n".join(prolog_blocks)
+    # Prolog-like blocks (tagged with an alias) plus untagged blocks if requested
+    blocks = (
+        code.strip() if strip_whitespace else code
+        for lang, code in extract_all_code_blocks(text)
+        if (lang and lang in PROLOG_ALIASES) or (not lang and include_untagged)
+    )
+
+    # Only join non-empty blocks
+    return "\n\n".join(block for block in blocks if block)
 
 
 def extract_rules_from_response(
@@ -141,8 +139,12 @@ def extract_rules_from_response(
         >>> extract_rules_from_response(response)
         'initiatedAt(foo(X)=true, T) :- bar(X, T).'
     """
+    # Fast path: without a fence there are no code blocks to parse
+    if "```" not in response:
+        return response.strip() if fallback_to_full else ""
+
     extracted = extract_prolog_blocks(response)
-    
+
     if extracted:
         return extracted
     
@@ -1,6 +1,7 @@
 """Generate LaTeX TikZ bar charts from RTEC-LLM results JSON files."""
 
 import json
+from itertools import zip_longest
 from pathlib import Path
 from typing import Any
 
@@ -166,13 +167,10 @@ def generate_latex_bar_chart(
     left_items = items[:mid]
     right_items = items[mid:]
 
-    glossary_rows = []
-    for i in range(mid):
-        left = left_items[i] if i < len(left_items) else ("", "")
-        right = right_items[i] if i < len(right_items) else ("", "")
-        glossary_rows.append(f"  {left[0]} & {left[1]} & {right[0]} & {right[1]} \\\\")
-
-    glossary_table = "\n".join(glossary_rows)
+    glossary_table = "\n".join(
+        f"  {left[0]} & {left[1]} & {right[0]} & {right[1]} \\\\"
+        for left, right in zip_longest(left_items, right_items, fillvalue=("", ""))
+    )
 
     # Build excluded fluents list for caption
     excluded_names = [f"\\emph{{{r['fluent_name']}}}" for r in excluded]
@@ -1,11 +1,11 @@
 """Shared test fixtures for the test suite."""
 import pytest
-from typing import List
+from typing import Tuple
 
 from src.interfaces.models import FewShotExample
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_activity_description() -> str:
     """Sample activity description for testing."""
     return (
@@ -15,10 +15,10 @@ def sample_activity_description() -> str:
     )
 
 
-@pytest.fixture
-def sample_prerequisites() -> List[FewShotExample]:
-    """Sample prerequisite fluents for testing."""
-    return [
+@pytest.fixture(scope="session")
+def sample_prerequisites() -> Tuple[FewShotExample, ...]:
+    """Sample prerequisite fluents for testing (read-only, shared per session)."""
+    return (
         FewShotExample(
             user='Generate rules for "withinArea": starts when vessel enters area.',
             assistant='initiatedAt(withinArea(Vessel, AreaType)=true, T) :- happensAt(entersArea(Vessel, Area), T).'
@@ -27,11 +27,11 @@ def sample_prerequisites() -> List[FewShotExample]:
             user='Generate rules for "stopped": starts when vessel becomes idle.',
             assistant='initiatedAt(stopped(Vessel)=nearPorts, T) :- happensAt(stop_start(Vessel), T).'
         ),
-    ]
+    )
 
 
-@pytest.fixture
-def empty_prerequisites() -> List[FewShotExample]:
-    """Empty prerequisites list."""
-    return []
+@pytest.fixture(scope="session")
+def empty_prerequisites() -> Tuple[FewShotExample, ...]:
+    """Empty prerequisites."""
+    return ()
 
@@ -0,0 +1 @@
+"""Tests for the simLP feedback client."""
@@ -0,0 +1,62 @@
+"""Tests for FeedbackClient result caching."""
+import dataclasses
+
+import pytest
+
+from src.feedback import client as client_module
+from src.feedback.client import FeedbackClient
+
+
+@pytest.fixture
+def simlp_calls(monkeypatch):
+    """Replace simLP with a stub and record each call it receives."""
+    calls = []
+
+    def fake_parse_and_compute_distance(**kwargs):
+        calls.append(kwargs)
+        return {}, {}, 0.5, {"concept": "feedback"}
+
+    monkeypatch.setattr(
+        client_module, "parse_and_compute_distance", fake_parse_and_compute_distance
+    )
+    return calls
+
+
+class TestFeedbackClientCache:
+    """Tests for the opt-in simLP result cache."""
+
+    def test_repeated_inputs_scored_once_when_cached(self, simlp_calls, tmp_path):
+        """Identical inputs call simLP once when caching is enabled."""
+        client = FeedbackClient(log_file=tmp_path / "simlp.log", cache_results=True)
+
+        first = client.evaluate("rules", "ground truth")
+        second = client.evaluate("rules", "ground truth")
+
+        assert len(simlp_calls) == 1
+        assert second.similarity == first.similarity
+
+    def test_cached_result_cannot_be_reassigned(self, simlp_calls, tmp_path):
+        """A shared cached result is frozen so one caller cannot alter it for others."""
+        client = FeedbackClient(log_file=tmp_path / "simlp.log", cache_results=True)
+        result = client.evaluate("rules", "ground truth")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.similarity = 1.0
+
+    def test_repeated_inputs_scored_each_time_without_cache(self, simlp_calls, tmp_path):
+        """With cache_results=False every evaluation reaches simLP."""
+        client = FeedbackClient(log_file=tmp_path / "simlp.log", cache_results=False)
+
+        client.evaluate("rules", "ground truth")
+        client.evaluate("rules", "ground truth")
+
+        assert len(simlp_calls) == 2
+
+    def test_cache_disabled_by_default(self, simlp_calls, tmp_path):
+        """Caching is opt-in, so every attempt is logged by simLP by default."""
+        client = FeedbackClient(log_file=tmp_path / "simlp.log")
+
+        client.evaluate("rules", "ground truth")
+        client.evaluate("rules", "ground truth")
+
+        assert len(simlp_calls) == 2
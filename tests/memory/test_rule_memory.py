@@ -0,0 +1,80 @@
+"""Tests for RuleMemory storage and prerequisite formatting."""
+import pytest
+
+from src.memory.rule_memory import RuleMemory
+
+
+GAP_RULES = (
+    "initiatedAt(gap(Vessel)=nearPorts, T) :-\n"
+    "    happensAt(gap_start(Vessel), T).\n"
+    "terminatedAt(gap(Vessel)=_Status, T) :-\n"
+    "    happensAt(gap_end(Vessel), T)."
+)
+
+
+@pytest.fixture
+def memory() -> RuleMemory:
+    """Memory holding a single multi-line fluent definition."""
+    memory = RuleMemory()
+    memory.add_entry("gap", GAP_RULES, score=0.9)
+    return memory
+
+
+class TestMembership:
+    """Tests for looking up stored fluents by name."""
+    
+    def test_contains_stored_fluent(self, memory):
+        """``in`` reports stored fluents, matching has_entry."""
+        assert "gap" in memory
+        assert memory.has_entry("gap")
+    
+    def test_does_not_contain_missing_fluent(self, memory):
+        """``in`` is False for fluents that were never stored."""
+        assert "lowSpeed" not in memory
+        assert not memory.has_entry("lowSpeed")
+
+
+class TestAddEntry:
+    """Tests for storing entries."""
+    
+    def test_storage_key_is_name_as_given(self):
+        """Entries are stored under the fluent name exactly as passed."""
+        memory = RuleMemory()
+        memory.add_entry(" gap ", GAP_RULES, score=0.9)
+        
+        assert memory.list_fluents() == [" gap "]
+        assert memory.get_entry(" gap ").fluent_name == "gap"
+
+
+class TestGetFormattedRules:
+    """Tests for formatting stored rules as prompt context."""
+    
+    def test_prolog_format_keeps_rules_verbatim(self, memory):
+        """Prolog output contains the rules as written, not one line per character."""
+        formatted = memory.get_formatted_rules(["gap"], format_style="prolog")
+        
+        assert formatted == (
+            "% Prerequisite fluent definitions:\n"
+            "\n"
+            "% Fluent: gap (score: 0.900)\n"
+            f"{GAP_RULES}\n"
+        )
+    
+    def test_markdown_format_keeps_rules_verbatim(self, memory):
+        """Markdown output wraps the rules as written in a prolog code block."""
+        formatted = memory.get_formatted_rules(["gap"], format_style="markdown")
+        
+        assert formatted == (
+            "## Prerequisite Fluent Definitions\n"
+            "\n"
+            "### gap (score: 0.900)\n"
+            "\n"
+            "```prolog\n"
+            f"{GAP_RULES}\n"
+            "```\n"
+        )
+    
+    def test_missing_fluent_raises(self, memory):
+        """Requesting a fluent that is not stored raises ValueError."""
+        with pytest.raises(ValueError, match="lowSpeed"):
+            memory.get_formatted_rules(["gap", "lowSpeed"])
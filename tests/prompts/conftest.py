@@ -0,0 +1,20 @@
+"""Fixtures shared by the prompt builder tests."""
+import pytest
+
+from src.prompts import factory
+
+
+@pytest.fixture(autouse=True)
+def _snapshot_registry():
+    """Restore the prompt builder registry after each test.
+
+    Tests that call register_prompt_builder() would otherwise leak their
+    domains into later tests, making results depend on execution order.
+    """
+    registry = dict(factory._BUILDER_REGISTRY)
+    instances = dict(factory._INSTANCE_CACHE)
+    yield
+    factory._BUILDER_REGISTRY.clear()
+    factory._BUILDER_REGISTRY.update(registry)
+    factory._INSTANCE_CACHE.clear()
+    factory._INSTANCE_CACHE.update(instances)
@@ -116,6 +116,26 @@ class TestPrerequisiteInjection:
         assert result.fewshots[1].user == sample_prerequisites[0].user
         assert result.fewshots[2].user == sample_prerequisites[1].user
     
+    def test_duplicate_prerequisites_included_once(self, sample_activity_description):
+        """A prerequisite identical to a domain example is not repeated."""
+        example = FewShotExample(user="Shared", assistant="shared output")
+        builder = StubPromptBuilder(examples=[example])
+        
+        result = builder.build_prompt(
+            sample_activity_description, prerequisites=[example, example]
+        )
+        
+        assert result.fewshots == [example]
+    
+    def test_duplicate_domain_examples_included_once(self, sample_activity_description):
+        """Repeated domain examples are deduplicated without prerequisites too."""
+        example = FewShotExample(user="Shared", assistant="shared output")
+        builder = StubPromptBuilder(examples=[example, example])
+        
+        result = builder.build_prompt(sample_activity_description)
+        
+        assert result.fewshots == [example]
+    
     def test_empty_prerequisites_list_same_as_none(self, sample_activity_description):
         """Empty list behaves same as None."""
         builder = StubPromptBuilder()
@@ -49,12 +49,12 @@ class TestGetPromptBuilder:
         error_msg = str(exc_info.value)
         assert "msa" in error_msg or "har" in error_msg
     
-    def test_returns_new_instance_each_time(self):
-        """Each call returns a new instance (not singleton)."""
+    def test_returns_cached_instance(self):
+        """Repeated calls reuse the same (stateless) builder instance."""
         builder1 = get_prompt_builder("msa")
-        builder2 = get_prompt_builder("msa")
+        builder2 = get_prompt_builder("MSA")
         
-        assert builder1 is not builder2
+        assert builder1 is builder2
 
 
 class TestListAvailableDomains:
@@ -71,6 +71,13 @@ class TestListAvailableDomains:
         assert "msa" in domains
         assert "har" in domains
 
+    def test_includes_newly_registered_domain(self):
+        """Domains registered after a previous listing are included."""
+        list_available_domains()
+        register_prompt_builder("listed_later", MSAPromptBuilder)
+
+        assert "listed_later" in list_available_domains()
+
 
 class TestRegisterPromptBuilder:
     """Tests for dynamic registration of new builders."""
@@ -124,6 +131,29 @@ class TestRegisterPromptBuilder:
         
         builder = get_prompt_builder("overwrite_test")
         assert builder.domain_name == "v2"
+    
+    def test_register_invalidates_cached_instance(self):
+        """Re-registering a domain replaces an already cached instance."""
+        
+        class Builder1(PromptBuilder):
+            @property
+            def domain_name(self) -> str:
+                return "v1"
+            def get_system_prompt(self) -> str:
+                return "v1 prompt"
+            def get_fewshot_examples(self):
+                return []
+        
+        class Builder2(Builder1):
+            @property
+            def domain_name(self) -> str:
+                return "v2"
+        
+        register_prompt_builder("invalidate_test", Builder1)
+        assert get_prompt_builder("invalidate_test").domain_name == "v1"
+        
+        register_prompt_builder("invalidate_test", Builder2)
+        assert get_prompt_builder("invalidate_test").domain_name == "v2"
 
 
 class TestBuilderPolymorphism: